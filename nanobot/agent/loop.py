@@ -20,7 +20,7 @@ from nanobot.agent.tools.spawn import SpawnTool
 from nanobot.agent.tools.cron import CronTool
 from nanobot.agent.tools.solana import (
     GetBalanceTool, VerifyAgentTool, LookupAgentTool, 
-    GetTrustScoreTool, RegisterAgentTool, GetMyIdentityTool
+    GetTrustScoreTool, RegisterAgentTool, GetMyIdentityTool, close_client
 )
 from nanobot.agent.subagent import SubagentManager
 from nanobot.session.manager import SessionManager
@@ -119,6 +119,13 @@ class AgentLoop:
         self._running = True
         logger.info("Agent loop started")
         
+        try:
+            await self._run_loop()
+        finally:
+            await self.close()
+    
+    async def _run_loop(self) -> None:
+        """Consume inbound messages until stopped."""
         while self._running:
             try:
                 # Wait for next message
@@ -148,6 +155,10 @@ class AgentLoop:
         self._running = False
         logger.info("Agent loop stopping")
     
+    async def close(self) -> None:
+        """Release resources held by tools (pooled HTTP connections)."""
+        await close_client()
+    
     async def _process_message(self, msg: InboundMessage) -> OutboundMessage | None:
         """
         Process a single inbound message.
@@ -1,285 +1,654 @@
 """Solana blockchain tools for SAID-verified AI agents."""
 
-import json
+import asyncio
 import os
-import urllib.request
+import random
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from json.encoder import encode_basestring_ascii as _esc
 from pathlib import Path
 from typing import Any
 
+import httpx
+import orjson
+
 from nanobot.agent.tools.base import Tool
 
 # SAID API
 SAID_API = "https://api.saidprotocol.com"
 
+# Solana RPC; SOLANA_RPC_URL may list several comma-separated endpoints
+DEFAULT_RPC_URL = "https://api.mainnet-beta.solana.com"
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Base58 public key: 32 bytes encode to 32-44 chars, no 0/O/I/l
+_B58_RE = re.compile(rb"[1-9A-HJ-NP-Za-km-z]{32,44}")
+
+LAMPORTS_PER_SOL = 1_000_000_000
+
+
+def _lamports_to_sol(lamports: int) -> str:
+    """Format lamports as an exact decimal SOL string (no float rounding)."""
+    q, r = divmod(lamports, LAMPORTS_PER_SOL)
+    return f"{q}.{r:09d}"
+
+
+def _valid_pubkey(address: str) -> bool:
+    """Cheap local check that a string looks like a Solana public key."""
+    return _B58_RE.fullmatch(address.encode()) is not None
+
+# Shared keep-alive HTTP client, created lazily and reused for the process lifetime
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client used by all SAID/Solana tools."""
+    global _client
+    if _client is None or _client.is_closed:
+        # HTTP/2 multiplexes parallel tool calls over one connection per host;
+        # servers without h2 support are negotiated down to HTTP/1.1 via ALPN.
+        # httpx has no resolver cache, so hosts are only looked up when a pooled
+        # connection is opened; a long idle expiry keeps DNS off the hot path.
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=50,
+                keepalive_expiry=300.0,
+            ),
+            timeout=10.0,
+        )
+    return _client
+
+
+# Retry policy for idempotent calls (reads and read-only RPC)
+_RETRY_ATTEMPTS = 4
+_RETRY_BASE_S = 0.2
+_RETRY_MAX_S = 3.0
+_RETRY_STATUS = {429, 502, 503, 504}
+
+
+def _retry_delay(attempt: int, response: httpx.Response | None) -> float:
+    """Backoff before the next attempt: Retry-After if given, else full-jitter exponential."""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), _RETRY_MAX_S)
+    return random.uniform(0, min(_RETRY_MAX_S, _RETRY_BASE_S * 2 ** attempt))
+
+
+@dataclass
+class _Endpoint:
+    """An RPC endpoint and the time until which it is considered unhealthy."""
+    url: str
+    unhealthy_until: float = 0.0
+
+
+class _RpcPool:
+    """Round-robin over RPC endpoints, skipping ones that recently failed."""
+    
+    COOLDOWN_S = 30.0
+    
+    def __init__(self, spec: str):
+        self.spec = spec
+        self.endpoints = [_Endpoint(u.strip()) for u in spec.split(",") if u.strip()]
+        self._counter = 0
+    
+    def pick(self) -> _Endpoint:
+        """Next healthy endpoint in rotation, or the one that recovers soonest."""
+        now = time.monotonic()
+        n = len(self.endpoints)
+        start, self._counter = self._counter, self._counter + 1
+        for i in range(n):
+            endpoint = self.endpoints[(start + i) % n]
+            if endpoint.unhealthy_until <= now:
+                return endpoint
+        return min(self.endpoints, key=lambda e: e.unhealthy_until)
+    
+    def mark_failed(self, endpoint: _Endpoint) -> None:
+        endpoint.unhealthy_until = time.monotonic() + self.COOLDOWN_S
+    
+    def has_healthy(self) -> bool:
+        now = time.monotonic()
+        return any(e.unhealthy_until <= now for e in self.endpoints)
+
+
+_rpc_pool: _RpcPool | None = None
+
+
+def _get_rpc_pool() -> _RpcPool:
+    """Return the endpoint pool for SOLANA_RPC_URL, rebuilt if the variable changes."""
+    global _rpc_pool
+    spec = os.getenv("SOLANA_RPC_URL") or DEFAULT_RPC_URL
+    if _rpc_pool is None or _rpc_pool.spec != spec:
+        _rpc_pool = _RpcPool(spec)
+    return _rpc_pool
+
+
+# Max concurrent requests per upstream, overridable to match the provider's budget
+_CONCURRENCY_LIMITS = {
+    "said": ("SAID_MAX_CONCURRENCY", 16),
+    "solana": ("SOLANA_MAX_CONCURRENCY", 8),
+}
+_semaphores: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+
+
+def _concurrency_limit(kind: str) -> int:
+    """Read an upstream's limit from the environment; invalid values fall back to the default."""
+    env, default = _CONCURRENCY_LIMITS[kind]
+    try:
+        limit = int(os.getenv(env, default))
+    except ValueError:
+        return default
+    return max(limit, 1)
+
+
+def _semaphore(kind: str) -> asyncio.Semaphore:
+    """Return the concurrency limiter for an upstream ("said" or "solana") on the running loop."""
+    loop = asyncio.get_running_loop()
+    entry = _semaphores.get(kind)
+    if entry is None or entry[0] is not loop:
+        entry = _semaphores[kind] = (loop, asyncio.Semaphore(_concurrency_limit(kind)))
+    return entry[1]
+
+
+async def _request(method: str, target: str | _RpcPool, **kwargs: Any) -> httpx.Response:
+    """
+    Send an idempotent request, retrying transport errors and 429/5xx gateway responses.
+    
+    If target is an RPC pool, each attempt goes to the next healthy endpoint and
+    failing endpoints are put on cooldown; failover is immediate while any
+    endpoint is still healthy.
+    """
+    client = _get_client()
+    pool = target if isinstance(target, _RpcPool) else None
+    limit = _semaphore("solana" if pool else "said")
+    attempt = 0
+    while True:
+        final = attempt + 1 >= _RETRY_ATTEMPTS
+        endpoint = pool.pick() if pool else None
+        try:
+            async with limit:
+                r = await client.request(method, endpoint.url if endpoint else target, **kwargs)
+        except httpx.TransportError:
+            if final:
+                raise
+            r = None
+        else:
+            retryable = r.status_code in _RETRY_STATUS or (pool is not None and r.status_code >= 500)
+            if not retryable or final:
+                return r
+        
+        if pool:
+            pool.mark_failed(endpoint)
+        if not (pool and pool.has_healthy()):
+            await asyncio.sleep(_retry_delay(attempt, r))
+        attempt += 1
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result to a JSON string."""
+    return orjson.dumps(obj).decode()
+
+
+# Error results have a fixed shape, so splice the escaped message into a template
+def _err(msg: str) -> str:
+    return '{"error":' + _esc(msg) + '}'
+
+
+def _verify_err(msg: str) -> str:
+    return '{"verified":false,"error":' + _esc(msg) + '}'
+
+
+def _register_err(msg: str) -> str:
+    return '{"success":false,"error":' + _esc(msg) + '}'
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+class _TTLCache:
+    """Small LRU cache whose entries expire after a fixed number of seconds."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+    
+    def get(self, key: str) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def discard(self, key: str) -> None:
+        self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        self._data.clear()
+
+
+# Decoded response bodies keyed by wallet; trust scores move faster than profiles
+_AGENT_CACHE = _TTLCache(maxsize=1024, ttl=60)
+_TRUST_CACHE = _TTLCache(maxsize=1024, ttl=30)
+# verify_said_agent results, paired with the profile body they were built from
+_VERIFY_RESULTS = _TTLCache(maxsize=1024, ttl=60)
+# Wallets the registry answered 404 for, kept briefly so unknown agents cost no request
+_AGENT_MISSES = _TTLCache(maxsize=1024, ttl=30)
+
+
+class _NotFoundError(Exception):
+    """The SAID API answered 404 (possibly cached) for a lookup."""
+
+# In-flight GETs by URL, so concurrent misses await one shared request
+_inflight: dict[str, asyncio.Task[str]] = {}
+
+
+async def _cached_get(
+    cache: _TTLCache, key: str, url: str, misses: _TTLCache | None = None
+) -> str:
+    """
+    GET a URL's body through a TTL cache.
+    
+    The decoded text is cached, so hits return it without copying.
+    
+    If a misses cache is given, 404s are remembered there and raised as
+    _NotFoundError; other non-2xx responses raise httpx.HTTPStatusError.
+    """
+    if (body := cache.get(key)) is not None:
+        return body
+    if misses is not None and misses.get(key):
+        raise _NotFoundError(url)
+    if (task := _inflight.get(url)) is None:
+        # The fetch runs as its own task so no single caller's cancellation
+        # decides the outcome for the others
+        task = asyncio.ensure_future(_fetch(cache, key, url, misses))
+        # Mark the outcome as retrieved even if every caller was cancelled
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        task.add_done_callback(lambda t: _inflight.pop(url, None))
+        _inflight[url] = task
+    return await asyncio.shield(task)
+
+
+async def _fetch(cache: _TTLCache, key: str, url: str, misses: _TTLCache | None) -> str:
+    """Perform the GET behind _cached_get and fill the caches."""
+    r = await _request("GET", url)
+    if r.status_code == 404 and misses is not None:
+        misses.set(key, True)
+        raise _NotFoundError(url)
+    r.raise_for_status()
+    cache.set(key, r.text)
+    return r.text
+
+
+async def _fetch_agent_raw(wallet: str) -> str:
+    """
+    Raw SAID profile for a wallet, shared by verify_said_agent and lookup_said_agent.
+    
+    Both tools read the same endpoint, so whichever runs second within the
+    cache window (or concurrently) reuses the first one's response.
+    """
+    return await _cached_get(
+        _AGENT_CACHE, wallet, f"{SAID_API}/api/agents/{wallet}", _AGENT_MISSES
+    )
+
+
+# Pre-serialized getBalance call; addresses are base58-validated so need no escaping
+_GETBALANCE_TEMPLATE = b'{"jsonrpc":"2.0","id":%d,"method":"getBalance","params":["%s"]}'
+
+
+class _BalanceBatcher:
+    """
+    Coalesces getBalance calls into JSON-RPC batches.
+    
+    Requests arriving within a short window are sent as one batched POST
+    (kept small, since large batches are throttled by most RPC providers),
+    and each reply is routed back to its caller by JSON-RPC id.
+    """
+    
+    MAX_BATCH = 20
+    WINDOW_S = 0.015
+    
+    def __init__(self):
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future]] | None = None
+        self._worker: asyncio.Task | None = None
+        self._dispatches: set[asyncio.Task] = set()
+    
+    async def get_balance(self, address: str) -> dict[str, Any]:
+        """Return the JSON-RPC response object for a single getBalance call."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._collect())
+        
+        fut = loop.create_future()
+        await self._queue.put((address, fut))
+        return await fut
+    
+    async def _collect(self) -> None:
+        """Gather queued requests into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.WINDOW_S
+            while len(batch) < self.MAX_BATCH:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Dispatch in the background so the next batch can start filling
+            task = loop.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+    
+    async def _dispatch(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        # A lone call is sent unbatched, since some RPC plans reject batch requests
+        if len(batch) == 1:
+            payload = _GETBALANCE_TEMPLATE % (0, batch[0][0].encode())
+        else:
+            payload = b"[" + b",".join(
+                _GETBALANCE_TEMPLATE % (i, address.encode()) for i, (address, _) in enumerate(batch)
+            ) + b"]"
+        try:
+            r = await _request("POST", _get_rpc_pool(), content=payload, headers=_JSON_HEADERS)
+            r.raise_for_status()
+            data = orjson.loads(r.content)
+            
+            # A single object is the reply to an unbatched call, or a batch-level error
+            if isinstance(data, dict):
+                replies = {i: data for i in range(len(batch))}
+            elif isinstance(data, list) and all(isinstance(item, dict) for item in data):
+                replies = {item.get("id"): item for item in data}
+            else:
+                raise ValueError("Malformed getBalance response from RPC")
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        
+        for i, (_, fut) in enumerate(batch):
+            if fut.done():
+                continue
+            if i in replies:
+                fut.set_result(replies[i])
+            else:
+                fut.set_exception(RuntimeError("No response for batched getBalance request"))
+
+
+_balance_batcher = _BalanceBatcher()
+
 
 class GetBalanceTool(Tool):
     """Get SOL balance for a wallet address."""
     
-    @property
-    def name(self) -> str:
-        return "get_sol_balance"
-    
-    @property
-    def description(self) -> str:
-        return "Get SOL balance for a Solana wallet address. Returns balance in SOL."
-    
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "address": {
-                    "type": "string",
-                    "description": "Solana wallet address (base58)"
-                }
-            },
-            "required": ["address"]
-        }
+    name = "get_sol_balance"
+    description = "Get SOL balance for a Solana wallet address. Returns balance in SOL."
+    parameters = {
+        "type": "object",
+        "properties": {
+            "address": {
+                "type": "string",
+                "description": "Solana wallet address (base58)"
+            }
+        },
+        "required": ["address"]
+    }
     
     async def execute(self, address: str) -> str:
+        if not _valid_pubkey(address):
+            return _err(f"Invalid Solana address: {address}")
         try:
-            rpc_url = os.getenv("SOLANA_RPC_URL", "https://api.mainnet-beta.solana.com")
-            payload = json.dumps({
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getBalance",
-                "params": [address]
-            }).encode()
-            
-            req = urllib.request.Request(
-                rpc_url,
-                data=payload,
-                headers={"Content-Type": "application/json"}
-            )
-            
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                data = json.loads(resp.read().decode())
-                if "result" in data:
-                    lamports = data["result"]["value"]
-                    sol = lamports / 1_000_000_000
-                    return json.dumps({"address": address, "balance_sol": sol, "balance_lamports": lamports})
-                else:
-                    return json.dumps({"error": data.get("error", "Unknown error")})
+            data = await _balance_batcher.get_balance(address)
+            if "result" in data:
+                lamports = data["result"]["value"]
+                return _dumps({
+                    "address": address,
+                    "balance_sol": _lamports_to_sol(lamports),
+                    "balance_lamports": lamports
+                })
+            else:
+                return _dumps({"error": data.get("error", "Unknown error")})
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return _err(str(e))
 
 
 class VerifyAgentTool(Tool):
     """Verify another agent's SAID identity."""
     
-    @property
-    def name(self) -> str:
-        return "verify_said_agent"
-    
-    @property
-    def description(self) -> str:
-        return "Verify if a wallet address is a registered SAID agent. Use before transacting with unknown agents."
-    
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "wallet": {
-                    "type": "string",
-                    "description": "Solana wallet address to verify"
-                }
-            },
-            "required": ["wallet"]
-        }
+    name = "verify_said_agent"
+    description = "Verify if a wallet address is a registered SAID agent. Use before transacting with unknown agents."
+    parameters = {
+        "type": "object",
+        "properties": {
+            "wallet": {
+                "type": "string",
+                "description": "Solana wallet address to verify"
+            }
+        },
+        "required": ["wallet"]
+    }
     
     async def execute(self, wallet: str) -> str:
+        if not _valid_pubkey(wallet):
+            return _verify_err(f"Invalid Solana address: {wallet}")
         try:
-            url = f"{SAID_API}/api/agents/{wallet}"
-            with urllib.request.urlopen(url, timeout=10) as resp:
-                agent = json.loads(resp.read().decode())
-                return json.dumps({
-                    "verified": True,
-                    "name": agent.get("name"),
-                    "wallet": agent.get("wallet"),
-                    "pda": agent.get("pda"),
-                    "isVerified": agent.get("isVerified"),
-                    "reputationScore": agent.get("reputationScore"),
-                    "description": agent.get("description"),
-                    "profile": f"https://www.saidprotocol.com/agent.html?wallet={wallet}"
-                })
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                return json.dumps({"verified": False, "error": "Agent not found in SAID registry"})
-            return json.dumps({"verified": False, "error": str(e)})
+            body = await _fetch_agent_raw(wallet)
+            # Repeat verifies of an unchanged cached profile skip the parse and re-serialize
+            if (hit := _VERIFY_RESULTS.get(wallet)) is not None and hit[0] is body:
+                return hit[1]
+            
+            agent = orjson.loads(body)
+            result = _dumps({
+                "verified": True,
+                "name": agent.get("name"),
+                "wallet": agent.get("wallet"),
+                "pda": agent.get("pda"),
+                "isVerified": agent.get("isVerified"),
+                "reputationScore": agent.get("reputationScore"),
+                "description": agent.get("description"),
+                "profile": f"https://www.saidprotocol.com/agent.html?wallet={wallet}"
+            })
+            _VERIFY_RESULTS.set(wallet, (body, result))
+            return result
+        except _NotFoundError:
+            return _verify_err("Agent not found in SAID registry")
         except Exception as e:
-            return json.dumps({"verified": False, "error": str(e)})
+            return _verify_err(str(e))
 
 
 class LookupAgentTool(Tool):
     """Get full SAID profile for an agent."""
     
-    @property
-    def name(self) -> str:
-        return "lookup_said_agent"
-    
-    @property
-    def description(self) -> str:
-        return "Get full SAID profile for an agent by wallet address, including reputation and skills."
-    
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "wallet": {
-                    "type": "string",
-                    "description": "Solana wallet address to lookup"
-                }
-            },
-            "required": ["wallet"]
-        }
+    name = "lookup_said_agent"
+    description = "Get full SAID profile for an agent by wallet address, including reputation and skills."
+    parameters = {
+        "type": "object",
+        "properties": {
+            "wallet": {
+                "type": "string",
+                "description": "Solana wallet address to lookup"
+            }
+        },
+        "required": ["wallet"]
+    }
     
     async def execute(self, wallet: str) -> str:
+        if not _valid_pubkey(wallet):
+            return _err(f"Invalid Solana address: {wallet}")
         try:
-            url = f"{SAID_API}/api/agents/{wallet}"
-            with urllib.request.urlopen(url, timeout=10) as resp:
-                return resp.read().decode()
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                return json.dumps({"error": "Agent not found"})
-            return json.dumps({"error": str(e)})
+            body = await _fetch_agent_raw(wallet)
+            return body
+        except _NotFoundError:
+            return _err("Agent not found")
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return _err(str(e))
 
 
 class GetTrustScoreTool(Tool):
     """Get trust score for an agent."""
     
-    @property
-    def name(self) -> str:
-        return "get_trust_score"
-    
-    @property
-    def description(self) -> str:
-        return "Get the trust score and trust network for a SAID agent."
-    
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "wallet": {
-                    "type": "string",
-                    "description": "Solana wallet address"
-                }
-            },
-            "required": ["wallet"]
-        }
+    name = "get_trust_score"
+    description = "Get the trust score and trust network for a SAID agent."
+    parameters = {
+        "type": "object",
+        "properties": {
+            "wallet": {
+                "type": "string",
+                "description": "Solana wallet address"
+            }
+        },
+        "required": ["wallet"]
+    }
     
     async def execute(self, wallet: str) -> str:
+        if not _valid_pubkey(wallet):
+            return _err(f"Invalid Solana address: {wallet}")
         try:
-            url = f"{SAID_API}/api/trust/{wallet}"
-            with urllib.request.urlopen(url, timeout=10) as resp:
-                return resp.read().decode()
+            body = await _cached_get(_TRUST_CACHE, wallet, f"{SAID_API}/api/trust/{wallet}")
+            return body
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return _err(str(e))
 
 
 class RegisterAgentTool(Tool):
     """Register as a SAID agent (pending status)."""
     
-    @property
-    def name(self) -> str:
-        return "register_said_agent"
-    
-    @property
-    def description(self) -> str:
-        return "Register a new agent on SAID Protocol with pending status (free, instant)."
-    
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "wallet": {
-                    "type": "string",
-                    "description": "Solana wallet address"
-                },
-                "name": {
-                    "type": "string",
-                    "description": "Agent name"
-                },
-                "description": {
-                    "type": "string",
-                    "description": "Agent description"
-                }
+    name = "register_said_agent"
+    description = "Register a new agent on SAID Protocol with pending status (free, instant)."
+    parameters = {
+        "type": "object",
+        "properties": {
+            "wallet": {
+                "type": "string",
+                "description": "Solana wallet address"
             },
-            "required": ["wallet", "name"]
-        }
+            "name": {
+                "type": "string",
+                "description": "Agent name"
+            },
+            "description": {
+                "type": "string",
+                "description": "Agent description"
+            }
+        },
+        "required": ["wallet", "name"]
+    }
     
     async def execute(self, wallet: str, name: str, description: str = "") -> str:
         try:
-            url = f"{SAID_API}/api/register/pending"
-            payload = json.dumps({
+            payload = orjson.dumps({
                 "wallet": wallet,
                 "name": name,
                 "description": description or f"{name} - AI Agent"
-            }).encode()
+            })
+            # Not retried: registration is not idempotent
+            async with _semaphore("said"):
+                r = await _get_client().post(
+                    f"{SAID_API}/api/register/pending", content=payload, headers=_JSON_HEADERS
+                )
+            r.raise_for_status()
             
-            req = urllib.request.Request(
-                url,
-                data=payload,
-                headers={"Content-Type": "application/json"},
-                method="POST"
-            )
+            # The wallet now exists, so drop any cached "not found" or stale profile
+            for cache in (_AGENT_MISSES, _AGENT_CACHE, _VERIFY_RESULTS):
+                cache.discard(wallet)
             
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                result = json.loads(resp.read().decode())
-                return json.dumps({
-                    "success": True,
-                    "wallet": result.get("wallet"),
-                    "pda": result.get("pda"),
-                    "profile": result.get("profile"),
-                    "status": "PENDING"
-                })
+            result = orjson.loads(r.content)
+            return _dumps({
+                "success": True,
+                "wallet": result.get("wallet"),
+                "pda": result.get("pda"),
+                "profile": result.get("profile"),
+                "status": "PENDING"
+            })
         except Exception as e:
-            return json.dumps({"success": False, "error": str(e)})
+            return _register_err(str(e))
 
 
 class GetMyIdentityTool(Tool):
     """Get the agent's own SAID identity from local config."""
     
+    name = "get_my_said_identity"
+    description = "Get your own SAID identity information from local said.json file."
+    parameters = {
+        "type": "object",
+        "properties": {}
+    }
+    
     def __init__(self, workspace: Path | None = None):
         self.workspace = workspace or Path.cwd()
-    
-    @property
-    def name(self) -> str:
-        return "get_my_said_identity"
-    
-    @property
-    def description(self) -> str:
-        return "Get your own SAID identity information from local said.json file."
-    
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {}
-        }
+        # Last identity file read, revalidated by mtime on each call
+        self._cached_path: Path | None = None
+        self._cached_mtime: int | None = None
+        self._cached_text: str | None = None
     
     async def execute(self) -> str:
-        # Check multiple locations
+        # Check multiple locations, in priority order
         paths = [
             self.workspace / "said.json",
             Path.home() / ".nanobot" / "said.json",
             Path.home() / ".config" / "said" / "identity.json"
         ]
         
+        # Fast path: reuse the cached file unless a higher-priority one has appeared
+        if self._cached_path in paths:
+            earlier = paths[:paths.index(self._cached_path)]
+            try:
+                if not any(p.exists() for p in earlier):
+                    if self._cached_path.stat().st_mtime_ns == self._cached_mtime:
+                        return self._cached_text
+                    if (text := await self._read(self._cached_path)) is not None:
+                        return text
+            except OSError:
+                pass
+        self._cached_path = None
+        
         for path in paths:
             if path.exists():
-                try:
-                    with open(path) as f:
-                        return f.read()
-                except Exception as e:
-                    continue
+                if (text := await self._read(path)) is not None:
+                    return text
         
-        return json.dumps({"error": "SAID identity not found. Register first with register_said_agent."})
+        return _err("SAID identity not found. Register first with register_said_agent.")
+    
+    async def _read(self, path: Path) -> str | None:
+        """Read an identity file off the event loop and remember it, or return None if unreadable."""
+        try:
+            mtime, text = await asyncio.to_thread(self._load, path)
+        except Exception:
+            return None
+        self._cached_path, self._cached_mtime, self._cached_text = path, mtime, text
+        return text
+    
+    @staticmethod
+    def _load(path: Path) -> tuple[int, str]:
+        mtime = path.stat().st_mtime_ns
+        with open(path) as f:
+            return mtime, f.read()
 
 
 # Export all tools
@@ -321,8 +321,11 @@ def agent(
     if message:
         # Single message mode
         async def run_once():
-            response = await agent_loop.process_direct(message, session_id)
-            console.print(f"\n{__logo__} {response}")
+            try:
+                response = await agent_loop.process_direct(message, session_id)
+                console.print(f"\n{__logo__} {response}")
+            finally:
+                await agent_loop.close()
         
         asyncio.run(run_once())
     else:
@@ -330,17 +333,20 @@ def agent(
         console.print(f"{__logo__} Interactive mode (Ctrl+C to exit)\n")
         
         async def run_interactive():
-            while True:
-                try:
-                    user_input = console.input("[bold blue]You:[/bold blue] ")
-                    if not user_input.strip():
-                        continue
-                    
-                    response = await agent_loop.process_direct(user_input, session_id)
-                    console.print(f"\n{__logo__} {response}\n")
-                except KeyboardInterrupt:
-                    console.print("\nGoodbye!")
-                    break
+            try:
+                while True:
+                    try:
+                        user_input = console.input("[bold blue]You:[/bold blue] ")
+                        if not user_input.strip():
+                            continue
+                        
+                        response = await agent_loop.process_direct(user_input, session_id)
+                        console.print(f"\n{__logo__} {response}\n")
+                    except KeyboardInterrupt:
+                        console.print("\nGoodbye!")
+                        break
+            finally:
+                await agent_loop.close()
         
         asyncio.run(run_interactive())
 
@@ -0,0 +1,272 @@
+import asyncio
+import json
+import os
+from typing import Any, Callable
+
+import httpx
+import pytest
+
+from nanobot.agent.tools import solana
+from nanobot.agent.tools.solana import (
+    GetBalanceTool,
+    GetMyIdentityTool,
+    GetTrustScoreTool,
+    LookupAgentTool,
+    RegisterAgentTool,
+    VerifyAgentTool,
+)
+
+WALLET = "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU"
+
+
+class MockAPI:
+    """Canned responses keyed by URL path; unknown paths return 404."""
+
+    def __init__(self) -> None:
+        self.routes: dict[str, tuple[int, Any] | Callable[[httpx.Request], Any]] = {}
+        self.requests: list[httpx.Request] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        await asyncio.sleep(0)  # yield like a real network call would
+        route = self.routes.get(request.url.path, (404, None))
+        if callable(route):
+            route = route(request)
+            if asyncio.iscoroutine(route):
+                route = await route
+        status, body = route
+        return httpx.Response(status, json=body)
+
+
+@pytest.fixture
+async def mock_api(monkeypatch):
+    api = MockAPI()
+    monkeypatch.setattr(solana, "_client", httpx.AsyncClient(transport=httpx.MockTransport(api)))
+    monkeypatch.setattr(solana, "_rpc_pool", None)
+    yield api
+    await solana.close_client()
+    solana._AGENT_CACHE.clear()
+    solana._TRUST_CACHE.clear()
+    solana._AGENT_MISSES.clear()
+    solana._VERIFY_RESULTS.clear()
+
+
+def rpc_balances(request: httpx.Request) -> tuple[int, Any]:
+    """Answer getBalance calls with a balance equal to each address length."""
+    calls = json.loads(request.content)
+    if isinstance(calls, dict):
+        return 200, {"id": calls["id"], "result": {"value": len(calls["params"][0])}}
+    return 200, [{"id": c["id"], "result": {"value": len(c["params"][0])}} for c in calls]
+
+
+async def test_get_balance(mock_api) -> None:
+    mock_api.routes["/"] = (200, {"id": 0, "result": {"value": 1_500_000_000}})
+    result = json.loads(await GetBalanceTool().execute(address=WALLET))
+    assert result["balance_lamports"] == 1_500_000_000
+    assert result["balance_sol"] == "1.500000000"
+    # A single call is sent as a plain JSON-RPC object, not a one-element batch
+    assert json.loads(mock_api.requests[0].content)["params"] == [WALLET]
+
+
+def test_lamports_to_sol_is_exact() -> None:
+    assert solana._lamports_to_sol(0) == "0.000000000"
+    assert solana._lamports_to_sol(1) == "0.000000001"
+    assert solana._lamports_to_sol(2**53 + 1) == "9007199.254740993"
+
+
+def test_error_templates_escape_messages() -> None:
+    msg = 'bad "wallet"\n\u00e9'
+    assert json.loads(solana._err(msg)) == {"error": msg}
+    assert json.loads(solana._verify_err(msg)) == {"verified": False, "error": msg}
+    assert json.loads(solana._register_err(msg)) == {"success": False, "error": msg}
+
+
+async def test_get_balance_batches_concurrent_calls(mock_api) -> None:
+    mock_api.routes["/"] = rpc_balances
+    wallets = [WALLET[:n] for n in range(32, 45)]
+    results = await asyncio.gather(*(GetBalanceTool().execute(address=w) for w in wallets))
+    assert [json.loads(r)["balance_lamports"] for r in results] == [len(w) for w in wallets]
+    assert len(mock_api.requests) == 1
+
+
+@pytest.mark.parametrize("body", [None, "busy", [1, 2]])
+async def test_get_balance_malformed_reply_returns_error(mock_api, body) -> None:
+    mock_api.routes["/"] = (200, body)
+    result = await asyncio.wait_for(GetBalanceTool().execute(address=WALLET), timeout=2)
+    assert json.loads(result)["error"]
+
+
+async def test_verify_agent_found(mock_api) -> None:
+    mock_api.routes[f"/api/agents/{WALLET}"] = (
+        200, {"name": "kai", "wallet": WALLET, "isVerified": True}
+    )
+    first = await VerifyAgentTool().execute(wallet=WALLET)
+    result = json.loads(first)
+    assert result["verified"] is True
+    assert result["name"] == "kai"
+    assert await VerifyAgentTool().execute(wallet=WALLET) is first
+
+
+async def test_verify_and_lookup_not_found(mock_api) -> None:
+    result = json.loads(await VerifyAgentTool().execute(wallet=WALLET))
+    assert result == {"verified": False, "error": "Agent not found in SAID registry"}
+    result = json.loads(await LookupAgentTool().execute(wallet=WALLET))
+    assert result == {"error": "Agent not found"}
+    # The 404 is cached, so the second lookup makes no request
+    assert len(mock_api.requests) == 1
+
+
+async def test_register_clears_cached_not_found(mock_api) -> None:
+    result = json.loads(await VerifyAgentTool().execute(wallet=WALLET))
+    assert result["verified"] is False
+
+    mock_api.routes["/api/register/pending"] = (200, {"wallet": WALLET, "pda": "p"})
+    mock_api.routes[f"/api/agents/{WALLET}"] = (200, {"name": "kai", "wallet": WALLET})
+    result = json.loads(await RegisterAgentTool().execute(wallet=WALLET, name="kai"))
+    assert result["success"] is True
+
+    result = json.loads(await VerifyAgentTool().execute(wallet=WALLET))
+    assert result["verified"] is True
+    assert result["name"] == "kai"
+
+
+@pytest.mark.parametrize("address", ["", "abc", WALLET + "x" * 5, WALLET[:-1] + "0", "ünïcode" * 6])
+async def test_invalid_address_skips_network(mock_api, address) -> None:
+    for tool in (GetBalanceTool(), VerifyAgentTool(), LookupAgentTool(), GetTrustScoreTool()):
+        param = "address" if isinstance(tool, GetBalanceTool) else "wallet"
+        result = json.loads(await tool.execute(**{param: address}))
+        assert result["error"].startswith("Invalid Solana address")
+    assert mock_api.requests == []
+
+
+async def test_rpc_fails_over_to_healthy_endpoint(mock_api, monkeypatch) -> None:
+    monkeypatch.setenv("SOLANA_RPC_URL", "http://rpc-a, http://rpc-b")
+
+    def route(request: httpx.Request) -> tuple[int, Any]:
+        return rpc_balances(request) if request.url.host == "rpc-b" else (503, None)
+
+    mock_api.routes["/"] = route
+    for _ in range(2):
+        result = json.loads(await GetBalanceTool().execute(address=WALLET))
+        assert result["balance_lamports"] == len(WALLET)
+    # rpc-a is on cooldown after its first failure, so only rpc-b is tried again
+    assert [r.url.host for r in mock_api.requests] == ["rpc-a", "rpc-b", "rpc-b"]
+
+
+async def test_transient_errors_are_retried(mock_api, monkeypatch) -> None:
+    monkeypatch.setattr(solana, "_retry_delay", lambda attempt, response: 0)
+    replies = iter([(503, None), (429, None), (200, {"score": 7})])
+    mock_api.routes[f"/api/trust/{WALLET}"] = lambda request: next(replies)
+    result = json.loads(await GetTrustScoreTool().execute(wallet=WALLET))
+    assert result == {"score": 7}
+    assert len(mock_api.requests) == 3
+
+
+async def test_said_requests_respect_concurrency_limit(mock_api, monkeypatch) -> None:
+    monkeypatch.setenv("SAID_MAX_CONCURRENCY", "2")
+    monkeypatch.setattr(solana, "_semaphores", {})
+    active = peak = 0
+
+    async def route(request: httpx.Request) -> tuple[int, Any]:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return 200, {"score": 1}
+
+    mock_api.routes.update({f"/api/trust/{WALLET[:n]}": route for n in range(32, 40)})
+    await asyncio.gather(*(GetTrustScoreTool().execute(wallet=WALLET[:n]) for n in range(32, 40)))
+    assert len(mock_api.requests) == 8
+    assert peak == 2
+
+
+@pytest.mark.parametrize("value, expected", [("0", 1), ("-3", 1), ("lots", 16), ("4", 4)])
+def test_concurrency_limit_is_validated(monkeypatch, value, expected) -> None:
+    monkeypatch.setenv("SAID_MAX_CONCURRENCY", value)
+    assert solana._concurrency_limit("said") == expected
+
+
+async def test_agent_lookups_are_cached_and_coalesced(mock_api) -> None:
+    mock_api.routes[f"/api/agents/{WALLET}"] = (200, {"name": "kai", "wallet": WALLET})
+    bodies = await asyncio.gather(*(LookupAgentTool().execute(wallet=WALLET) for _ in range(5)))
+    # Hits return the cached text itself rather than a fresh copy
+    assert await LookupAgentTool().execute(wallet=WALLET) is bodies[0]
+    result = json.loads(await VerifyAgentTool().execute(wallet=WALLET))
+    assert result["name"] == "kai"
+    assert len(mock_api.requests) == 1
+
+
+def test_ttl_cache_expiry_and_eviction(monkeypatch) -> None:
+    now = [0.0]
+    monkeypatch.setattr(solana.time, "monotonic", lambda: now[0])
+    cache = solana._TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    now[0] = 11
+    assert cache.get("c") is None
+
+
+async def test_concurrent_misses_share_errors(mock_api) -> None:
+    mock_api.routes[f"/api/agents/{WALLET}"] = (500, None)
+    results = await asyncio.gather(
+        VerifyAgentTool().execute(wallet=WALLET), LookupAgentTool().execute(wallet=WALLET)
+    )
+    assert all("500" in json.loads(r)["error"] for r in results)
+    assert len(mock_api.requests) == 1
+    assert solana._inflight == {}
+
+
+async def test_cancelled_caller_does_not_cancel_shared_fetch(mock_api) -> None:
+    release = asyncio.Event()
+
+    async def route(request: httpx.Request) -> tuple[int, Any]:
+        await release.wait()
+        return 200, {"name": "kai", "wallet": WALLET}
+
+    mock_api.routes[f"/api/agents/{WALLET}"] = route
+    lookup = asyncio.create_task(LookupAgentTool().execute(wallet=WALLET))
+    await asyncio.sleep(0.01)
+    verify = asyncio.create_task(VerifyAgentTool().execute(wallet=WALLET))
+    await asyncio.sleep(0.01)
+    lookup.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert json.loads(await verify)["name"] == "kai"
+    assert lookup.cancelled()
+    assert len(mock_api.requests) == 1
+
+
+async def test_identity_is_cached_until_file_changes(tmp_path) -> None:
+    identity = tmp_path / "said.json"
+    identity.write_text('{"name": "a"}')
+    tool = GetMyIdentityTool(workspace=tmp_path)
+    assert await tool.execute() == '{"name": "a"}'
+
+    identity.write_text('{"name": "b"}')
+    os.utime(identity, ns=(0, identity.stat().st_mtime_ns + 1_000_000))
+    assert await tool.execute() == '{"name": "b"}'
+
+
+async def test_identity_prefers_workspace_file_once_it_appears(tmp_path, monkeypatch) -> None:
+    home, workspace = tmp_path / "home", tmp_path / "ws"
+    (home / ".nanobot").mkdir(parents=True)
+    workspace.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    (home / ".nanobot" / "said.json").write_text('{"src": "home"}')
+    tool = GetMyIdentityTool(workspace=workspace)
+    assert await tool.execute() == '{"src": "home"}'
+
+    (workspace / "said.json").write_text('{"src": "workspace"}')
+    assert await tool.execute() == '{"src": "workspace"}'
+
+
+async def test_client_is_shared_until_closed() -> None:
+    client = solana._get_client()
+    assert solana._get_client() is client
+    await solana.close_client()
+    assert solana._client is None